@@ -7,11 +7,42 @@ Created on Mar 19, 2015
 from __future__ import (absolute_import, division, print_function)
 
 import re
+from collections import OrderedDict
 
 from .lookup import X_COORDINATES, Y_COORDINATES
 from .utils import GridPadding
 
 
+# Compiled once; the parsers below run for every variable in a dataset.
+PADDING_PATTERN = re.compile(r'([a-zA-Z0-9_]+:) ([a-zA-Z0-9_]+) (\(padding: [a-zA-Z]+\))')
+PADDING_PARENS_PATTERN = re.compile(r'[\(\)]')
+AXES_PATTERN = re.compile('([a-zA-Z]: [a-zA-Z_]+)')
+VECTOR_AXIS_PATTERN = re.compile('[a-z_]+_[xyz]_[a-z_]+')
+VECTOR_DIRECTION_PATTERN = re.compile('_[xyz]_')
+
+
+def infer_coordinate_axis(name, standard_name=''):
+    """
+    Guess whether a variable holds x or y coordinates from its
+    name or standard name.
+
+    :param str name: variable name
+    :param str standard_name: variable standard name, if any
+    :return: 'x', 'y', or None if neither could be inferred
+    :rtype: str
+
+    """
+    name_lower = name.lower()
+    standard_name_lower = standard_name.lower()
+    if (any(x in name_lower for x in X_COORDINATES) or
+       any(x in standard_name_lower for x in X_COORDINATES)):
+        return 'x'
+    elif (any(y in name_lower for y in Y_COORDINATES) or
+          any(y in standard_name_lower for y in Y_COORDINATES)):
+        return 'y'
+    return None
+
+
 def find_grid_topology_var(nc):
     """
     Get the variable from a netCDF dataset
@@ -63,8 +94,7 @@ def parse_padding(padding_str, mesh_topology_var):
     :rtype: list.
 
     """
-    p = re.compile('([a-zA-Z0-9_]+:) ([a-zA-Z0-9_]+) (\(padding: [a-zA-Z]+\))')
-    padding_matches = p.findall(padding_str)
+    padding_matches = PADDING_PATTERN.findall(padding_str)
     padding_type_list = []
     for padding_match in padding_matches:
         raw_dim, raw_sub_dim, raw_padding_var = padding_match
@@ -72,7 +102,7 @@ def parse_padding(padding_str, mesh_topology_var):
         sub_dim = raw_sub_dim
         # Remove parentheses. (That is why regular expressions are bad!
         # You need a commend to explain what is going on!!)
-        cleaned_padding_var = re.sub('[\(\)]', '', raw_padding_var)
+        cleaned_padding_var = PADDING_PARENS_PATTERN.sub('', raw_padding_var)
         # Get the padding value and remove spaces.
         padding_type = cleaned_padding_var.split(':')[1].strip()
         grid_padding = GridPadding(mesh_topology_var=mesh_topology_var,
@@ -92,8 +122,7 @@ def parse_padding(padding_str, mesh_topology_var):
 
 
 def parse_axes(axes_attr):
-    p = re.compile('([a-zA-Z]: [a-zA-Z_]+)')
-    matches = p.findall(axes_attr)
+    matches = AXES_PATTERN.findall(axes_attr)
     x_axis = None
     y_axis = None
     z_axis = None
@@ -111,11 +140,9 @@ def parse_axes(axes_attr):
 
 
 def parse_vector_axis(variable_standard_name):
-    p = re.compile('[a-z_]+_[xyz]_[a-z_]+')
-    match = p.match(variable_standard_name)
+    match = VECTOR_AXIS_PATTERN.match(variable_standard_name)
     if match is not None:
-        direction_pattern = re.compile('_[xyz]_')
-        direction_substr = direction_pattern.search(match.string).group()
+        direction_substr = VECTOR_DIRECTION_PATTERN.search(match.string).group()
         vector_direction = direction_substr.replace('_', '').upper()
     else:
         vector_direction = None
@@ -123,15 +150,34 @@ def parse_vector_axis(variable_standard_name):
 
 
 class NetCDFDataset(object):
+    """
+    Class containing methods to help with finding
+    the grid variables of an SGRID compliant dataset.
+
+    :param nc: netCDF dataset
+    :type nc: netCDF4.Dataset
+    :param str topology_variable: name of the grid_topology variable,
+                                  if the caller has already located it.
+                                  Otherwise it is found here, raising
+                                  ValueError if the dataset is not
+                                  SGRID compliant.
+
+    """
 
-    def __init__(self, nc):
+    def __init__(self, nc, topology_variable=None):
         self.nc = nc
         # in case a user as a version netcdf C library < 4.1.2
         try:
             self._filepath = nc.filepath()
         except ValueError:
             self._filepath = None
-        self.sgrid_compliant_file()
+        self._location_index = None
+        self._variable_index = None
+        # Callers that already located the grid_topology variable
+        # have validated the dataset; skip scanning it a second time.
+        if topology_variable is None:
+            topology_variable = find_grid_topology_var(nc)
+        self.topology_variable = topology_variable
 
     def find_node_coordinates(self, node_dimensions):
         """
@@ -139,26 +185,16 @@ class NetCDFDataset(object):
         cell vertices.
 
         """
-        nc_vars = self.nc.variables
         node_dims = node_dimensions.split(' ')
         node_dim_set = set(node_dims)
         x_node_coordinate = None
         y_node_coordinate = None
-        for nc_var in nc_vars.keys():
-            nc_var_obj = nc_vars[nc_var]
-            nc_var_dims = nc_var_obj.dimensions
-            nc_var_dim_set = set(nc_var_dims)
-            name_lower = nc_var_obj.name.lower()
-            try:
-                standard_name_lower = nc_var_obj.standard_name.lower()
-            except AttributeError:
-                standard_name_lower = ''
+        variable_index = self._index_variables()
+        for nc_var, (nc_var_dim_set, axis) in variable_index.items():
             if nc_var_dim_set == node_dim_set:
-                if (any(x in name_lower for x in X_COORDINATES) or
-                   any(x in standard_name_lower for x in X_COORDINATES)):
+                if axis == 'x':
                     x_node_coordinate = nc_var
-                elif (any(y in name_lower for y in Y_COORDINATES) or
-                      any(y in standard_name_lower for y in Y_COORDINATES)):
+                elif axis == 'y':
                     y_node_coordinate = nc_var
             if x_node_coordinate is not None and y_node_coordinate is not None:
                 # Exit the loop once both x and y coordinates are found.
@@ -174,10 +210,13 @@ class NetCDFDataset(object):
         keys = kwargs.keys()
         for nc_var in nc_vars.keys():
             nc_var_obj = nc_vars[nc_var]
-            nc_var_attrs = dir(nc_var_obj)  # All object attributes.
+            # Names of the variable's netCDF attributes; cheaper than
+            # listing every attribute of the object with dir().
+            nc_var_attrs = set(nc_var_obj.ncattrs())
             # Check to see if the requested attributes are in the
             # variable object if not, don't bother with it.
-            if set(keys).issubset(nc_var_attrs):
+            if all(key in nc_var_attrs or hasattr(nc_var_obj, key)
+                   for key in keys):
                 attr_tracking = {}
                 for key in keys:
                     nc_var_attr_value = getattr(nc_var_obj, key)
@@ -186,6 +225,55 @@ class NetCDFDataset(object):
                     matches.append(nc_var)
         return matches
 
+    def find_variables_by_location(self, location_str):
+        """
+        Find the names of variables with a location attribute
+        equal to location_str.
+
+        The variables are grouped by location in a single pass
+        the first time this is called, so repeated lookups for
+        face, edge1, and edge2 coordinates don't rescan the
+        attributes of every variable in the dataset.
+
+        :param str location_str: the location value to search for
+        :return: names of variables with a matching location
+        :rtype: list
+
+        """
+        self._index_variables()
+        return list(self._location_index.get(location_str, []))
+
+    def _index_variables(self):
+        """
+        Walk the dataset's variables once, grouping them by location
+        and recording each one's dimensions and inferred coordinate
+        axis. The coordinate searches work from this index instead of
+        rereading every variable's metadata.
+
+        :return: variable name -> (set of dimensions, 'x', 'y', or None)
+        :rtype: collections.OrderedDict
+
+        """
+        if self._variable_index is None:
+            location_index = {}
+            variable_index = OrderedDict()
+            nc_vars = self.nc.variables
+            for nc_var in nc_vars.keys():
+                nc_var_obj = nc_vars[nc_var]
+                nc_var_attrs = nc_var_obj.ncattrs()
+                if 'location' in nc_var_attrs:
+                    location = nc_var_obj.location
+                    location_index.setdefault(location, []).append(nc_var)
+                if 'standard_name' in nc_var_attrs:
+                    standard_name = nc_var_obj.standard_name
+                else:
+                    standard_name = ''
+                axis = infer_coordinate_axis(nc_var, standard_name)
+                variable_index[nc_var] = (set(nc_var_obj.dimensions), axis)
+            self._location_index = location_index
+            self._variable_index = variable_index
+        return self._variable_index
+
     def find_coordinates_by_location(self, location_str, topology_dim):
         """
         Find a grid coordinates variables with a location attribute equal
@@ -199,7 +287,7 @@ class NetCDFDataset(object):
 
         """
         nc_vars = self.nc.variables
-        vars_with_location = self.find_variables_by_attr(location=location_str)
+        vars_with_location = self.find_variables_by_location(location_str)
         x_coordinate = None
         y_coordinate = None
         z_coordinate = None
@@ -211,28 +299,17 @@ class NetCDFDataset(object):
             except AttributeError:
                 # Run through this if a location attributed is defined,
                 # but not coordinates.
-                potential_coordinates = []
-                for nc_var in nc_vars.keys():
-                    nc_var_obj = nc_vars[nc_var]
-                    nc_var_dim_set = set(nc_var_obj.dimensions)
+                variable_index = self._index_variables()
+                for nc_var, (nc_var_dim_set, axis) in variable_index.items():
                     if (nc_var_dim_set.issubset(location_var_dims) and
                        nc_var != var_with_location and
                        len(nc_var_dim_set) > 0):
-                        potential_coordinates.append(nc_var_obj)
-                for potential_coordinate in potential_coordinates:
-                    pc_name = potential_coordinate.name
-                    try:
-                        pc_std_name = potential_coordinate.standard_name
-                    except AttributeError:
-                        pc_std_name = ''
-                    if (any(x in pc_name.lower() for x in X_COORDINATES) or
-                       any(x in pc_std_name.lower() for x in X_COORDINATES)):
-                        x_coordinate = pc_name
-                    elif (any(y in pc_name.lower() for y in Y_COORDINATES) or
-                          any(y in pc_std_name.lower() for y in Y_COORDINATES)):  # noqa
-                        y_coordinate = pc_name
-                    else:
-                        z_coordinate = pc_name  # this might not always work...
+                        if axis == 'x':
+                            x_coordinate = nc_var
+                        elif axis == 'y':
+                            y_coordinate = nc_var
+                        else:
+                            z_coordinate = nc_var  # this might not always work...
             else:
                 lvc_split = location_var_coordinates.strip().split(' ')
                 for lvc in lvc_split:
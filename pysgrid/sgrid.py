@@ -27,6 +27,15 @@ class SGrid(object):
 
     topology_dimension = 2
 
+    grid_names = ('node', 'center', 'edge1', 'edge2')
+
+    # Inverse of the bilinear map from a unit square's corners, shared
+    # by every cell when computing the interpolation coefficients.
+    _bilinear_inverse = np.linalg.inv(np.array(([1, 0, 0, 0],
+                                                [1, 0, 1, 0],
+                                                [1, 1, 1, 1],
+                                                [1, 1, 0, 0])))
+
     def __init__(self,
                  node_lon=None,
                  node_lat=None,
@@ -93,12 +102,18 @@ class SGrid(object):
         self.tree = tree
         self._l_coeffs = {}
         self._m_coeffs = {}
+        # Per-grid caches for the search trees and memoized results.
+        self._cell_trees = dict.fromkeys(self.grid_names)
+        self._kd_trees = dict.fromkeys(self.grid_names)
+        self._ind_memo_dict = dict.fromkeys(self.grid_names)
+        self._alpha_memo_dict = dict.fromkeys(self.grid_names)
 
     @classmethod
     def load_grid(cls, nc):
-        if isinstance(nc, Dataset):
-            pass
-        else:
+        # A dataset handed in by the caller may be closed as soon as
+        # this returns; one opened here stays open with the grid.
+        caller_owned = isinstance(nc, Dataset)
+        if not caller_owned:
             nc = Dataset(nc, 'r')
         topology_var = find_grid_topology_var(nc)
         sa = SGridAttributes(nc, cls.topology_dimension, topology_var)
@@ -147,6 +162,10 @@ class SGrid(object):
                     vertical_dimensions=vertical_dimensions,
                     vertical_padding=vertical_padding)
         sa.get_variable_attributes(sgrid)
+        if caller_owned and angles is None:
+            # The lazy angles property would read the cell centers from
+            # a dataset the caller may already have closed.
+            sgrid.angles = sgrid._derive_angles()
         return sgrid
 
     def get_all_face_padding(self):
@@ -174,18 +193,42 @@ class SGrid(object):
         with Dataset(filepath, 'w') as nclocal:
             grid_vars = self._save_common_components(nclocal)
             # Add attributes to the grid_topology variable.
-            grid_vars.face_dimensions = self.face_dimensions
+            grid_attrs = OrderedDict([('face_dimensions', self.face_dimensions)])
             if self.vertical_dimensions is not None:
-                grid_vars.vertical_dimensions = self.vertical_dimensions
+                grid_attrs['vertical_dimensions'] = self.vertical_dimensions
             if self.face_coordinates is not None:
-                grid_vars.face_coordinates = ' '.join(self.face_coordinates)
+                grid_attrs['face_coordinates'] = ' '.join(self.face_coordinates)
+            grid_vars.setncatts(grid_attrs)
 
     @property
     def non_grid_variables(self):
+        grid_variables = set(self.grid_variables)
         non_grid_variables = [variable for variable in self.variables if
-                              variable not in self.grid_variables]
+                              variable not in grid_variables]
         return non_grid_variables
 
+    @property
+    def angles(self):
+        # Deriving the angles reads both cell center coordinate arrays
+        # in full, so wait until they are actually asked for. Grids
+        # loaded from a caller's Dataset have them derived up front.
+        if self._angles is None:
+            self._angles = self._derive_angles()
+        return self._angles
+
+    @angles.setter
+    def angles(self, angles):
+        self._angles = angles
+
+    def _derive_angles(self):
+        if self.center_lon is None or self.center_lat is None:
+            return None
+        # FIXME: Get rid of pair_arrays.
+        cell_centers = pair_arrays(self.center_lon, self.center_lat)
+        centers_start = cell_centers[..., :-1, :]
+        centers_end = cell_centers[..., 1:, :]
+        return calculate_angle_from_true_east(centers_start, centers_end)
+
     @property
     def nodes(self):
         return np.stack((self.node_lon, self.node_lat), axis=-1)
@@ -208,11 +251,8 @@ class SGrid(object):
                                             center_lat_obj.dimensions)
         center_lon[:] = self.center_lon[:]
         center_lat[:] = self.center_lat[:]
-        try:
+        if self.node_coordinates is not None:
             node_lon, node_lat = self.node_coordinates
-        except TypeError:
-            pass
-        else:
             node_lon_obj = getattr(self, node_lon)
             grid_node_lon = nc_file.createVariable(node_lon_obj.variable,
                                                    node_lon_obj.dtype,
@@ -226,19 +266,22 @@ class SGrid(object):
         grid_var_obj = getattr(self, grid_var)
         grid_vars = nc_file.createVariable(grid_var_obj.variable,
                                            grid_var_obj.dtype)
-        grid_vars.cf_role = 'grid_topology'
-        grid_vars.topology_dimension = self.topology_dimension
-        grid_vars.node_dimensions = self.node_dimensions
+        # Collect the attributes and write them in a single call
+        # rather than one nc_put_att round-trip per attribute.
+        grid_attrs = OrderedDict([('cf_role', 'grid_topology'),
+                                  ('topology_dimension', self.topology_dimension),
+                                  ('node_dimensions', self.node_dimensions)])
         if self.edge1_dimensions is not None:
-            grid_vars.edge1_dimensions = self.edge1_dimensions
+            grid_attrs['edge1_dimensions'] = self.edge1_dimensions
         if self.edge2_dimensions is not None:
-            grid_vars.edge2_dimensions = self.edge2_dimensions
+            grid_attrs['edge2_dimensions'] = self.edge2_dimensions
         if self.node_coordinates is not None:
-            grid_vars.node_coordinates = ' '.join(self.node_coordinates)
+            grid_attrs['node_coordinates'] = ' '.join(self.node_coordinates)
         if self.edge1_coordinates is not None:
-            grid_vars.edge1_coordinates = ' '.join(self.edge1_coordinates)
+            grid_attrs['edge1_coordinates'] = ' '.join(self.edge1_coordinates)
         if self.edge2_coordinates is not None:
-            grid_vars.edge2_coordinates = ' '.join(self.edge2_coordinates)
+            grid_attrs['edge2_coordinates'] = ' '.join(self.edge2_coordinates)
+        grid_vars.setncatts(grid_attrs)
         if hasattr(self, 'angle'):
             angle_obj = getattr(self, 'angle', None)
             grid_angle = nc_file.createVariable(angle_obj.variable,
@@ -259,12 +302,13 @@ class SGrid(object):
                 continue
             else:
                 axes = []
+                var_attrs = OrderedDict()
                 if dataset_var_obj.grid is not None:
-                    dataset_grid_var.grid = grid_var
+                    var_attrs['grid'] = grid_var
                 if dataset_var_obj.standard_name is not None:
-                    dataset_grid_var.standard_name = dataset_var_obj.standard_name  # noqa
+                    var_attrs['standard_name'] = dataset_var_obj.standard_name
                 if dataset_var_obj.coordinates is not None:
-                    dataset_grid_var.coordinates = ' '.join(dataset_var_obj.coordinates)  # noqa
+                    var_attrs['coordinates'] = ' '.join(dataset_var_obj.coordinates)  # noqa
                 if dataset_var_obj.x_axis is not None:
                     x_axis = 'X: {0}'.format(dataset_var_obj.x_axis)
                     axes.append(x_axis)
@@ -275,7 +319,9 @@ class SGrid(object):
                     z_axis = 'Z: {0}'.format(dataset_var_obj.z_axis)
                     axes.append(z_axis)
                 if axes:
-                    dataset_grid_var.axes = ' '.join(axes)
+                    var_attrs['axes'] = ' '.join(axes)
+                if var_attrs:
+                    dataset_grid_var.setncatts(var_attrs)
         return grid_vars
 
     def _get_grid_vars(self, name):
@@ -326,32 +372,26 @@ class SGrid(object):
             return None
 
     def _compute_transform_coeffs(self, grid):
-        if not hasattr(self, '_l_coeffs'):
-            self._l_coeffs = {}
-            self._m_coeffs = {}
         lon, lat = self._get_grid_vars(grid)
-        l_coeffs = self._l_coeffs[grid] = np.zeros((lon[0:-1, 0:-1].shape + (4,)), dtype=np.float64)
-        m_coeffs = self._m_coeffs[grid] = self._l_coeffs[grid].copy(0)
-
-        indices = np.stack(np.indices(lon[0:-1, 0:-1].shape), axis=-1).reshape(-1, 2)
-        polyx = self.get_variable_by_index(lon, indices)
-        polyy = self.get_variable_by_index(lat, indices)
+        y_size, x_size = lon.shape
+        coeffs_shape = (y_size - 1, x_size - 1, 4)
+        # Flat indices of the four corners of every cell, in the same
+        # order as get_variable_by_index. Computed once and used to
+        # gather both the lon and lat corners.
+        cell_starts = (np.arange(y_size - 1)[:, np.newaxis] * x_size +
+                       np.arange(x_size - 1)).reshape(-1, 1)
+        corners = cell_starts + [0, x_size, x_size + 1, 1]
+        polyx = np.take(lon[:], corners)
+        polyy = np.take(lat[:], corners)
         # for every cell
-        idx = val = None
-        A = np.array((
-                      [1, 0, 0, 0],
-                      [1, 0, 1, 0],
-                      [1, 1, 1, 1],
-                      [1, 1, 0, 0],
-                      ))
         polyx = np.matrix(polyx)
         polyy = np.matrix(polyy)
-        AI = np.linalg.inv(A)
+        AI = self._bilinear_inverse
         a = np.dot(AI, polyx.getH()).T
         b = np.dot(AI, polyy.getH()).T
 
-        self._l_coeffs[grid] = np.asarray(a).reshape(l_coeffs.shape)
-        self._m_coeffs[grid] = np.asarray(b).reshape(m_coeffs.shape)
+        self._l_coeffs[grid] = np.asarray(a).reshape(coeffs_shape)
+        self._m_coeffs[grid] = np.asarray(b).reshape(coeffs_shape)
 
     def get_efficient_slice(self,
                             points,
@@ -367,20 +407,23 @@ class SGrid(object):
         """
         if indices is None:
             indices = self.locate_faces(points, grid, _memo, _copy, _hash)
-        ymin = indices[:, 0].astype('uint32').min()
-        xmin = indices[:, 1].astype('uint32').min()
-        y_slice = slice(ymin, indices[:, 0].max() + 2)
-        x_slice = slice(xmin, indices[:, 1].max() + 2)
+        # locate_faces already masks points that are off the grid; only
+        # mask the negative indices ourselves when given a plain array.
+        if not isinstance(indices, np.ma.MaskedArray):
+            indices = np.ma.masked_less(indices, 0)
+        ymin, xmin = indices.min(axis=0)
+        ymax, xmax = indices.max(axis=0)
+        y_slice = slice(ymin, ymax + 2)
+        x_slice = slice(xmin, xmax + 2)
         return (y_slice, x_slice)
 
     def get_lines(self, grid='node'):
         """
         TEMPORARY
         """
-        grid_names = ['node', 'center', 'edge1', 'edge2']
-        if grid not in grid_names:
+        if grid not in self.grid_names:
             raise ValueError(
-                'Name not recognized. Grid must be in {0}'.format(grid_names))
+                'Name not recognized. Grid must be in {0}'.format(list(self.grid_names)))
         lons = getattr(self, grid + '_lon')
         lats = getattr(self, grid + '_lat')
         return np.ma.dstack((lons[:], lats[:]))
@@ -411,17 +454,6 @@ class SGrid(object):
         This version utilizes the CellTree data structure.
 
         """
-
-        if not hasattr(self, '_ind_memo_dict'):
-            self._ind_memo_dict = {'node': None,
-                                 'edge1': None,
-                                 'edge2': None,
-                                 'center': None}
-        if not hasattr(self, ')_cell_trees'):
-            self._cell_trees = {'node': None,
-                                'edge1': None,
-                                'edge2': None,
-                                'center': None}
         if _memo:
             if _hash is None:
                 _hash = self._hash_of_pts(points)
@@ -457,11 +489,6 @@ class SGrid(object):
                        _memo=False,
                        _copy=False,
                        _hash=None):
-        if not hasattr(self, '_kd_trees'):
-            self._kd_trees = {'node': None,
-                              'edge1': None,
-                              'edge2': None,
-                              'center': None}
         points = np.asarray(points, dtype=np.float64)
         just_one = (points.ndim == 1)
         points = points.reshape(-1, 2)
@@ -525,11 +552,6 @@ class SGrid(object):
     def build_kdtree(self, grid='node'):
         """Builds the kdtree for the specified grid"""
 
-        if not hasattr(self, '_kd_trees'):
-            self._kd_trees = {'node': None,
-                              'edge1': None,
-                              'edge2': None,
-                              'center': None}
         lon, lat = self._get_grid_vars(grid)
         if lon is None or lat is None:
             raise ValueError(
@@ -546,17 +568,6 @@ class SGrid(object):
         :param grid: which grid to biuld the celltree for. options are:
                      'node', 'edge1', 'edge2', 'center'
         """
-
-        if not hasattr(self, '_ind_memo_dict'):
-            self._ind_memo_dict = {'node': None,
-                                   'edge1': None,
-                                   'edge2': None,
-                                   'center': None}
-        if not hasattr(self, '_trees'):
-            self._cell_trees = {'node': None,
-                                'edge1': None,
-                                'edge2': None,
-                                'center': None}
         try:
             from cell_tree2d import CellTree
         except ImportError:
@@ -571,9 +582,12 @@ class SGrid(object):
                                                           lat[:].reshape(-1)))).astype(np.float64)
         y_size = lon.shape[0]
         x_size = lon.shape[1]
-        lin_faces = np.array([np.array([[x, x + 1, x + x_size + 1, x + x_size]
-                                        for x in range(0, x_size - 1, 1)]) + y * x_size for y in range(0, y_size - 1)])
-        lin_faces = np.ascontiguousarray(lin_faces.reshape(-1, 4).astype(np.int32))
+        # Node indices of each face, built with broadcasting rather than
+        # a Python loop over every cell.
+        cell_starts = (np.arange(y_size - 1)[:, np.newaxis] * x_size +
+                       np.arange(x_size - 1)).reshape(-1, 1)
+        lin_faces = cell_starts + [0, 1, x_size + 1, x_size]
+        lin_faces = np.ascontiguousarray(lin_faces.astype(np.int32))
         self._cell_trees[grid] = (CellTree(lin_nodes, lin_faces), lin_nodes, lin_faces)
 
     def nearest_var_to_points(self,
@@ -686,6 +700,51 @@ class SGrid(object):
         result = np.sum(vals, axis=1)
         return result
 
+    def interpolate_vars_to_points(self,
+                                   points,
+                                   variables,
+                                   slices=None):
+        """
+        Interpolates several variables to the same array of points.
+        :param points: Nx2 Array of points to be interpolated to.
+        :param variables: Sequence of variable data arrays, each with the same
+                          shape as one of the grids.
+        :param slices: Leading slices (e.g. time and depth) applied to every variable.
+        :return: List of interpolated arrays, one per variable.
+
+        The points are located and the interpolation alphas are computed
+        once per grid rather than once per variable, e.g.
+
+        u, v = sgrid.interpolate_vars_to_points(points, [nc.variables['u'], nc.variables['v']],
+                                                slices=(time_idx, depth_idx))
+
+        """
+        points = points.reshape(-1, 2)
+        located = {}
+        results = []
+        for variable in variables:
+            grid = self.infer_location(variable)
+            if grid not in located:
+                ind = self.locate_faces(points, grid)
+                if (ind.mask).all():
+                    alphas = None
+                else:
+                    if self._l_coeffs.get(grid, None) is None:
+                        self._compute_transform_coeffs(grid)
+                    alphas = self.interpolation_alphas(points, ind, grid)
+                located[grid] = (ind, alphas)
+            ind, alphas = located[grid]
+            if alphas is None:
+                results.append(np.ma.masked_all((points.shape[0])))
+                continue
+            results.append(self.interpolate_var_to_points(points,
+                                                          variable,
+                                                          indices=ind,
+                                                          grid=grid,
+                                                          alphas=alphas,
+                                                          slices=slices))
+        return results
+
     def infer_location(self, variable):
         """
         Assuming default is psi grid, check variable dimensions to determine which grid
@@ -776,11 +835,6 @@ class SGrid(object):
             return (l, m)
 
         # convert physical (x,y) to logical (l,m) on the interval (0,1)
-        if not hasattr(self, '_alpha_memo_dict'):
-            self._alpha_memo_dict = {'node': None,
-                                     'edge1': None,
-                                     'edge2': None,
-                                     'center': None}
         if _memo:
             if _hash is None:
                 _hash = self._hash_of_pts(points)
@@ -788,15 +842,11 @@ class SGrid(object):
             if result is not None:
                 return result
 
-        lons, lats = self._get_grid_vars(grid)
         if indices is None:
             indices = self.locate_faces(points, grid, _memo, _copy, _hash)
 
         sl = [yslice, xslice] = self.get_efficient_slice(points, indices, grid, _memo, _copy, _hash)
 
-        lons = lons[sl]
-        lats = lats[sl]
-
         indices = indices - [sl[0].start, sl[1].start]
 
         reflats = points[:, 1]
@@ -827,7 +877,7 @@ class SGridAttributes(object):
 
     def __init__(self, nc, topology_dim, topology_variable):
         self.nc = nc
-        self.ncd = NetCDFDataset(self.nc)
+        self.ncd = NetCDFDataset(self.nc, topology_variable)
         self.topology_dim = topology_dim
         self.topology_variable = topology_variable
         self.topology_var = self.nc.variables[self.topology_variable]
@@ -838,8 +888,9 @@ class SGridAttributes(object):
         return grid_dims
 
     def get_topology_var(self):
-        grid_topology_var = find_grid_topology_var(self.nc)
-        return grid_topology_var
+        # The topology variable was located when this object was
+        # created; don't scan every variable's attributes again.
+        return self.topology_variable
 
     def get_attr_dimension(self, attr_name):
         try:
@@ -885,21 +936,15 @@ class SGridAttributes(object):
             sgrid_var = SGridVariable.create_variable(nc_var, sgrid)
             setattr(sgrid, sgrid_var.variable, sgrid_var)
             dataset_variables.append(nc_var.name)
-            if hasattr(nc_var, 'grid'):
+            if sgrid_var.grid is not None:
                 grid_variables.append(nc_var.name)
         sgrid.variables = dataset_variables
         sgrid.grid_variables = grid_variables
 
     def get_angles(self):
-        angles = self.nc.variables.get('angle')
-        if not angles:
-            # FIXME: Get rid of pair_arrays.
-            center_lon, center_lat = self.get_cell_center_lat_lon()
-            cell_centers = pair_arrays(center_lon, center_lat)
-            centers_start = cell_centers[..., :-1, :]
-            centers_end = cell_centers[..., 1:, :]
-            angles = calculate_angle_from_true_east(centers_start, centers_end)
-        return angles
+        # When the dataset has no angle variable, SGrid.angles derives
+        # them from the cell centers on first access.
+        return self.nc.variables.get('angle')
 
     def get_cell_center_lat_lon(self):
         try:
@@ -924,7 +969,7 @@ class SGridAttributes(object):
     def get_cell_edge1_lat_lon(self):
         try:
             edge1_lon_var, edge1_lat_var = self.get_attr_coordinates('edge1_coordinates')
-        except:
+        except TypeError:
             edge1_lon, edge1_lat = None, None
         else:
             edge1_lon = self.nc[edge1_lon_var]
@@ -952,9 +997,4 @@ def load_grid(nc):
     :rtype: sgrid.SGrid
 
     """
-    if isinstance(nc, Dataset):
-        pass
-    else:
-        nc = Dataset(nc, 'r')
-
     return SGrid.load_grid(nc)
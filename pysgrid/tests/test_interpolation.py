@@ -53,6 +53,14 @@ def test_locate_faces():
             (indices.mask == ind_ans.mask).all())
 
 
+def test_locate_faces_reuses_celltree():
+    points = [[2, 2], [4, 4]]
+    sgrid.locate_faces(points, 'node')
+    tree = sgrid._cell_trees['node'][0]
+    sgrid.locate_faces(points, 'node')
+    assert sgrid._cell_trees['node'][0] is tree
+
+
 def test_points_in_polys():
     points = np.array(
         [[0, 0],
@@ -102,6 +110,34 @@ def test_interpolation_alphas():
     assert(np.all(alphas_e2 == answer_e2))
 
 
+def test_interpolate_vars_to_points():
+    points = np.array(([2.5, 2.5], [2.5, 4.5], [4.5, 2.5], [4.5, 4.5]))
+    results = sgrid.interpolate_vars_to_points(points, [c_var, n_var, e1_var])
+    answers = [sgrid.interpolate_var_to_points(points, c_var),
+               sgrid.interpolate_var_to_points(points, n_var),
+               sgrid.interpolate_var_to_points(points, e1_var)]
+    assert len(results) == len(answers)
+    for result, answer in zip(results, answers):
+        np.testing.assert_array_equal(result, answer)
+
+
+def test_interpolate_vars_to_points_same_grid():
+    points = np.array(([2.5, 2.5], [2.5, 4.5], [4.5, 2.5], [4.5, 4.5]))
+    results = sgrid.interpolate_vars_to_points(points, [c_var, c_var * 2])
+    answer = sgrid.interpolate_var_to_points(points, c_var)
+    np.testing.assert_array_equal(results[0], answer)
+    np.testing.assert_array_equal(results[1], answer * 2)
+
+
+def test_interpolate_vars_to_points_off_grid():
+    points = np.array(([100, 100], [-50, -50]))
+    results = sgrid.interpolate_vars_to_points(points, [c_var, n_var])
+    assert len(results) == 2
+    for result in results:
+        assert result.shape == (2,)
+        assert result.mask.all()
+
+
 def test_points_in_polys2():
     rectangle = np.array(([0, 0],
                           [2, 0],
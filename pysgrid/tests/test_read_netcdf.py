@@ -7,8 +7,10 @@ Created on Apr 7, 2015
 
 from __future__ import absolute_import, division, print_function
 
+import pytest
+
 from ..read_netcdf import NetCDFDataset, find_grid_topology_var
-from .write_nc_test_files import roms_sgrid, wrf_sgrid
+from .write_nc_test_files import non_compliant_sgrid, roms_sgrid, wrf_sgrid
 
 
 """
@@ -57,6 +59,41 @@ def test_find_variables_by_standard_name_none(roms_sgrid):
     assert result == []
 
 
+def test_find_variables_by_location(roms_sgrid):
+    nc_ds = NetCDFDataset(roms_sgrid)
+    result = nc_ds.find_variables_by_location('edge1')
+    expected = ['u']
+    assert result == expected
+
+
+def test_find_variables_by_location_none(roms_sgrid):
+    nc_ds = NetCDFDataset(roms_sgrid)
+    result = nc_ds.find_variables_by_location('volume')
+    assert result == []
+
+
+def test_find_variables_by_location_returns_copy(roms_sgrid):
+    nc_ds = NetCDFDataset(roms_sgrid)
+    result = nc_ds.find_variables_by_location('edge1')
+    result.append('v')
+    assert nc_ds.find_variables_by_location('edge1') == ['u']
+
+
+def test_topology_variable_located(roms_sgrid):
+    nc_ds = NetCDFDataset(roms_sgrid)
+    assert nc_ds.topology_variable == 'grid'
+
+
+def test_topology_variable_given(roms_sgrid):
+    nc_ds = NetCDFDataset(roms_sgrid, topology_variable='grid')
+    assert nc_ds.topology_variable == 'grid'
+
+
+def test_non_compliant_dataset(non_compliant_sgrid):
+    with pytest.raises(ValueError):
+        NetCDFDataset(non_compliant_sgrid)
+
+
 def test_sgrid_compliant_check(roms_sgrid):
     nc_ds = NetCDFDataset(roms_sgrid)
     result = nc_ds.sgrid_compliant_file()
@@ -83,6 +120,20 @@ def test_find_variable_by_attr(wrf_sgrid):
     assert result == expected
 
 
+def test_find_variable_by_name_and_attr(wrf_sgrid):
+    nc_ds = NetCDFDataset(wrf_sgrid)
+    result = nc_ds.find_variables_by_attr(name='U', location='edge1')
+    expected = ['U']
+    assert result == expected
+
+
+def test_find_variable_by_variable_property(wrf_sgrid):
+    nc_ds = NetCDFDataset(wrf_sgrid)
+    result = nc_ds.find_variables_by_attr(ndim=2)
+    expected = ['Times', 'XLAT', 'XLONG', 'ZNU', 'ZNW']
+    assert result == expected
+
+
 def test_find_variable_by_nonexistant_attr(wrf_sgrid):
     nc_ds = NetCDFDataset(wrf_sgrid)
     result = nc_ds.find_variables_by_attr(bird='tufted titmouse')
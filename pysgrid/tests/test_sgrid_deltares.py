@@ -9,10 +9,13 @@ from __future__ import (absolute_import, division, print_function)
 
 import pytest
 import numpy as np
+from netCDF4 import Dataset
 
 from ..sgrid import SGrid, load_grid
+from ..utils import calculate_angle_from_true_east, pair_arrays
 
 from .write_nc_test_files import (deltares_sgrid,
+                                  deltares_sgrid_no_face_coordinates,
                                   deltares_sgrid_no_optional_attr)
 
 
@@ -64,6 +67,40 @@ def test_grid_angles(sgrid):
     assert angles.shape == angles_shape
 
 
+def test_grid_angles_from_centers(sgrid):
+    cell_centers = pair_arrays(sgrid.center_lon, sgrid.center_lat)
+    expected = calculate_angle_from_true_east(cell_centers[..., :-1, :],
+                                              cell_centers[..., 1:, :])
+    np.testing.assert_array_equal(sgrid.angles, expected)
+
+
+def test_angles_without_face_coordinates(deltares_sgrid_no_face_coordinates):
+    sgrid = load_grid(deltares_sgrid_no_face_coordinates)
+    assert sgrid.face_coordinates is None
+    assert sgrid.angles is None
+
+
+def test_angles_after_dataset_closed(deltares_sgrid_no_optional_attr):
+    with Dataset(deltares_sgrid_no_optional_attr.filepath()) as nc:
+        sgrid = load_grid(nc)
+    angles = sgrid.angles
+    assert angles.shape == (4, 4)
+
+
+def test_angles_direct_construction():
+    center_lon, center_lat = np.meshgrid(np.arange(4.), np.arange(4.))
+    sgrid = SGrid(center_lon=center_lon, center_lat=center_lat)
+    cell_centers = pair_arrays(center_lon, center_lat)
+    expected = calculate_angle_from_true_east(cell_centers[..., :-1, :],
+                                              cell_centers[..., 1:, :])
+    np.testing.assert_array_equal(sgrid.angles, expected)
+    given_angles = np.zeros((4, 4))
+    sgrid = SGrid(center_lon=center_lon, center_lat=center_lat,
+                  angles=given_angles)
+    assert sgrid.angles is given_angles
+    assert SGrid().angles is None
+
+
 """
 Test SGrid Delft3d Dataset.
 
@@ -9,7 +9,8 @@ from __future__ import (absolute_import, division, print_function)
 
 import pytest
 
-from ..read_netcdf import (parse_axes, parse_padding, parse_vector_axis)
+from ..read_netcdf import (infer_coordinate_axis, parse_axes, parse_padding,
+                           parse_vector_axis)
 
 
 def test_xyz_axis_parse():
@@ -102,3 +103,18 @@ def test_std_name_with_transport_direction():
     direction = parse_vector_axis(standard_name_3)
     expected_direction = 'X'
     assert direction == expected_direction
+
+
+def test_coordinate_axis_from_name():
+    assert infer_coordinate_axis('lon_psi') == 'x'
+    assert infer_coordinate_axis('lat_psi') == 'y'
+
+
+def test_coordinate_axis_from_standard_name():
+    result = infer_coordinate_axis('grid_corner_1', 'latitude')
+    assert result == 'y'
+
+
+def test_coordinate_axis_unknown():
+    result = infer_coordinate_axis('temp', 'sea_water_temperature')
+    assert result is None
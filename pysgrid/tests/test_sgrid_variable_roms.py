@@ -157,3 +157,15 @@ def test_vector_directions(sgrid_variable_roms):
     zeta_axis = zeta_var.vector_axis
     assert u_vector_axis == expected_u_axis
     assert zeta_axis is None
+
+
+def test_min_max_follow_data(sgrid_variable_roms):
+    salt = sgrid_variable_roms['test_var_3']
+    salt_var = SGridVariable.create_variable(salt,
+                                             sgrid_variable_roms['sgrid'])
+    assert salt_var.max == np.max(salt[:])
+    assert salt_var.min == np.min(salt[:])
+    salt[0, 0, 0, 0] = 2
+    salt[0, 0, 0, 1] = -1
+    assert salt_var.max == 2
+    assert salt_var.min == -1
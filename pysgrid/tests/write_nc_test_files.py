@@ -79,6 +79,46 @@ def deltares_sgrid_no_optional_attr():
     os.remove(fname)
 
 
+@pytest.yield_fixture
+def deltares_sgrid_no_face_coordinates():
+    """
+    Like deltares_sgrid_no_optional_attr, but with no variable
+    located on the faces, so face coordinates cannot be inferred.
+
+    """
+    fname = tempfile.mktemp(suffix='.nc')
+    nc = Dataset(fname, 'w')
+    # Define dimensions.
+    nc.createDimension('MMAXZ', 4)
+    nc.createDimension('NMAXZ', 4)
+    nc.createDimension('MMAX', 4)
+    nc.createDimension('NMAX', 4)
+    # Define variables.
+    xcor = nc.createVariable('XCOR', 'f4', ('MMAX', 'NMAX'))  # nodes
+    ycor = nc.createVariable('YCOR', 'f4', ('MMAX', 'NMAX'))  # nodes
+    xz = nc.createVariable('XZ', 'f4', ('MMAXZ', 'NMAXZ'))  # centers
+    yz = nc.createVariable('YZ', 'f4', ('MMAXZ', 'NMAXZ'))  # centers
+    grid = nc.createVariable('grid', 'i4')
+    # Define variable attributes.
+    grid.cf_role = 'grid_topology'
+    grid.topology_dimension = 2
+    grid.node_dimensions = 'MMAX NMAX'
+    grid.face_dimensions = 'MMAXZ: MMAX (padding: low) NMAXZ: NMAX (padding: low)'  # noqa
+    xcor.standard_name = 'projection_x_coordinate'
+    ycor.standard_name = 'projection_y_coordinate'
+    xz.standard_name = 'projection_x_coordinate'
+    yz.standard_name = 'projection_y_coordinate'
+    # Create variable data.
+    xcor[:] = np.random.random((4, 4))
+    ycor[:] = np.random.random((4, 4))
+    xz[:] = np.random.random((4, 4))
+    yz[:] = np.random.random((4, 4))
+    nc.sync()
+    yield nc
+    nc.close()
+    os.remove(fname)
+
+
 @pytest.yield_fixture
 def deltares_sgrid():
     """
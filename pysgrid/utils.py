@@ -103,18 +103,16 @@ def determine_variable_slicing(sgrid_obj, nc_variable, method='center'):
         padding = sgrid_obj.all_padding()
     if method == 'center':
         for var_dim in var_dims:
-            try:
-                padding_info = next((info for info in padding if
-                                     info.face_dim == var_dim))
-            except StopIteration:
+            padding_info = next((info for info in padding if
+                                 info.face_dim == var_dim), None)
+            if padding_info is None:
                 slice_index = np.s_[:]
-                slice_indices += (slice_index,)
             else:
                 padding_val = padding_info[-1]
                 slice_datum = sgrid_obj.padding_slices[padding_val]
                 lower_slice, upper_slice = slice_datum
                 slice_index = np.s_[lower_slice:upper_slice]
-                slice_indices += (slice_index,)
+            slice_indices += (slice_index,)
     else:
         pass
     return slice_indices
@@ -135,15 +133,12 @@ def infer_avg_axes(sgrid_obj, nc_var_obj):
     else:
         padding = sgrid_obj.get_all_face_padding() + sgrid_obj.get_all_edge_padding()  # noqa
     # Define center averaging axis for a variable.
+    padding_info = None
+    avg_dim = None
     for var_dim in var_dims:
-        try:
-            padding_info = next((info for info in padding if
-                                 info.face_dim == var_dim))
-        except StopIteration:
-            padding_info = None
-            avg_dim = None
-            continue
-        else:
+        padding_info = next((info for info in padding if
+                             info.face_dim == var_dim), None)
+        if padding_info is not None:
             avg_dim = var_dim  # Name of the dimension we're averaging over.
             break  # Exit the loop once it's found.
     if padding_info is not None and avg_dim is not None:
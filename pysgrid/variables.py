@@ -75,22 +75,24 @@ class SGridVariable(object):
     @classmethod
     def create_variable(cls, nc_var_obj, sgrid_obj):
         variable = nc_var_obj.name
-        try:
+        # Fetch the attribute names once rather than attempting (and
+        # mostly failing) a lookup for each optional attribute.
+        nc_var_attrs = set(nc_var_obj.ncattrs())
+        if 'grid' in nc_var_attrs:
             grid = nc_var_obj.grid
-        except AttributeError:
+            center_axis, node_axis = infer_avg_axes(sgrid_obj, nc_var_obj)
+        else:
             grid = None
             center_axis = None
             node_axis = None
-        else:
-            center_axis, node_axis = infer_avg_axes(sgrid_obj, nc_var_obj)
         center_slicing = determine_variable_slicing(sgrid_obj,
                                                     nc_var_obj,
                                                     method='center')
         dimensions = nc_var_obj.dimensions
         dtype = nc_var_obj.dtype
-        try:
+        if 'location' in nc_var_attrs:
             location = nc_var_obj.location
-        except AttributeError:
+        else:
             location = infer_variable_location(sgrid_obj, nc_var_obj)
         if location == 'edge':
             if center_axis == 0:
@@ -99,27 +101,23 @@ class SGridVariable(object):
                 location = 'edge1'
             else:
                 location = None
-        try:
-            axes = nc_var_obj.axes
-        except AttributeError:
+        if 'axes' in nc_var_attrs:
+            x_axis, y_axis, z_axis = parse_axes(nc_var_obj.axes)
+        else:
             x_axis = None
             y_axis = None
             z_axis = None
-        else:
-            x_axis, y_axis, z_axis = parse_axes(axes)
-        try:
+        if 'standard_name' in nc_var_attrs:
             standard_name = nc_var_obj.standard_name
-        except AttributeError:
+            vector_axis = parse_vector_axis(standard_name)
+        else:
             standard_name = None
             vector_axis = None
-        else:
-            vector_axis = parse_vector_axis(standard_name)
-        try:
+        if 'coordinates' in nc_var_attrs:
             raw_coordinates = nc_var_obj.coordinates.strip()
-        except AttributeError:
-            coordinates = None
-        else:
             coordinates = tuple(raw_coordinates.split())
+        else:
+            coordinates = None
         sgrid_var = cls(variable=variable,
                         grid=grid,
                         x_axis=x_axis,